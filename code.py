@@ -5,18 +5,26 @@ Uses weather.gov (National Weather Service) API for weather data
 """
 
 import time
-import math
 import os
+import json
+import struct
+import binascii
+import alarm
 import board
+import bitmaptools
 import displayio
 import terminalio
 from adafruit_display_text import label
 from adafruit_magtag.magtag import MagTag
-import rtc
+from micropython import const
 import socketpool
+import ssl
 import wifi
-import adafruit_ntp
-import adafruit_imageload
+import adafruit_requests
+
+# CircuitPython's first json.loads() is much slower than later ones;
+# warm up the module once at import time
+json.dumps(None)
 
 # Initialize MagTag with status bar disabled
 magtag = MagTag(default_bg=0xFFFFFF)  # White background, no default UI
@@ -29,14 +37,154 @@ def get_setting(key, default=None):
     return value if value is not None else default
 
 # Screen dimensions: 296x128 pixels
-SCREEN_WIDTH = 296
-SCREEN_HEIGHT = 128
+SCREEN_WIDTH = const(296)
+SCREEN_HEIGHT = const(128)
 
 # Color definitions for e-ink display
-BLACK = 0x000000
-WHITE = 0xFFFFFF
+BLACK = const(0x000000)
+WHITE = const(0xFFFFFF)
+
+# Layout positions
+_LEFT_X = const(5)  # Month, date and day of week
+_MONTH_Y = const(12)
+_DATE_Y = const(24)  # Top of the large date number
+_DAY_Y = const(115)
+_ICON_X = const(110)  # Centered in middle area
+_ICON_Y = const(14)  # Vertically centered (128 - 100) / 2 = 14
+_CONDITION_Y = const(120)
+_TEMP_X = const(SCREEN_WIDTH - 55)
+_HIGH_Y = const(11)  # Top of the high temperature
+_LOW_Y = const(66)  # Top of the low temperature
+
+# alarm.sleep_memory layout (survives deep sleep)
+_SLEEP_STATE = const(0)  # 10 bytes: what is currently on screen
+_SLEEP_STATE_SIZE = const(10)
+_SLEEP_QUICK_REFRESHES = const(10)  # 1 byte: quick refreshes since the last full one
+_SLEEP_NTP_WAKES = const(11)  # 1 byte: wakes since the last NTP sync
+_SLEEP_FORECAST_CACHE = const(16)  # cache slot: last forecast and fetch time
+_SLEEP_POINTS_CACHE = const(256)  # cache slot: forecast URL for the coordinates
+_SLEEP_CACHE_SIZE = const(240)  # bytes per cache slot, including 2-byte length
+
+_CACHE_MAX_AGE = const(3600)  # NWS forecasts update at most hourly
+
+def _read_cache(offset):
+    """Load a JSON dict from a sleep_memory cache slot, or None if it's empty"""
+    mem = alarm.sleep_memory
+    length = struct.unpack("<H", mem[offset:offset + 2])[0]
+    if not 0 < length <= _SLEEP_CACHE_SIZE - 2:
+        return None
+    try:
+        value = json.loads(str(mem[offset + 2:offset + 2 + length], "utf-8"))
+    except ValueError:
+        return None  # Leftover data after power-up
+    return value if isinstance(value, dict) else None
+
+def _write_cache(offset, obj):
+    """Save a JSON dict to a sleep_memory cache slot"""
+    data = json.dumps(obj).encode()
+    if len(data) > _SLEEP_CACHE_SIZE - 2:
+        return  # Too big to cache; it will be fetched again next wake
+    alarm.sleep_memory[offset:offset + 2 + len(data)] = struct.pack("<H", len(data)) + data
+
+# Request headers for weather.gov (the API asks clients to identify themselves)
+_HEADERS = {
+    "Accept": "application/geo+json",
+    "User-Agent": "MagTagCalWx",
+}
+
+_PERIODS_MARKER = b'"periods"'
+
+def _read_periods(response, count):
+    """
+    Stream a forecast response and parse only the first few periods
+    Scans for the "periods" array and passes each {...} object to json.loads
+    so the rest of the multi-KB document is never materialized
+    """
+    periods = []
+    buf = bytearray()
+    found = False
+    depth = 0
+    start = 0
+    pos = 0
+    in_string = False
+    escaped = False
+
+    for chunk in response.iter_content(512):
+        buf.extend(chunk)
+        if not found:
+            index = buf.find(_PERIODS_MARKER)
+            if index < 0:
+                # Keep the tail in case the marker spans two chunks
+                del buf[:-len(_PERIODS_MARKER)]
+                continue
+            del buf[:index + len(_PERIODS_MARKER)]
+            found = True
+
+        while pos < len(buf):
+            char = buf[pos]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == 0x5C:  # backslash
+                    escaped = True
+                elif char == 0x22:  # closing quote
+                    in_string = False
+            elif char == 0x22:  # opening quote
+                in_string = True
+            elif char == 0x7B:  # {
+                if depth == 0:
+                    start = pos
+                depth += 1
+            elif char == 0x7D:  # }
+                depth -= 1
+                if depth == 0:
+                    periods.append(json.loads(buf[start:pos + 1].decode()))
+                    if len(periods) >= count:
+                        return periods
+                    del buf[:pos + 1]
+                    pos = -1
+            elif char == 0x5D and depth == 0:  # ] ends the periods array
+                return periods
+            pos += 1
+
+        # Nothing to keep between period objects
+        if depth == 0:
+            del buf[:]
+            pos = 0
+
+    return periods
+
+def _get_forecast_url(session, latitude, longitude):
+    """
+    Look up the weather.gov forecast URL for a location
+    The grid never changes for fixed coordinates, so it is cached permanently
+    """
+    points = _read_cache(_SLEEP_POINTS_CACHE)
+    if (points and points.get("forecast_url")
+            and points.get("lat") == latitude and points.get("lon") == longitude):
+        return points["forecast_url"]
 
-def get_weather_data():
+    points_url = f"https://api.weather.gov/points/{latitude},{longitude}"
+
+    points_response = session.get(points_url, headers=_HEADERS)
+    try:
+        points_data = points_response.json()
+    finally:
+        points_response.close()
+
+    # Step 2: Get the forecast URL from the points data
+    if "properties" not in points_data or "forecast" not in points_data["properties"]:
+        raise ValueError("Invalid response from points API")
+
+    forecast_url = points_data["properties"]["forecast"]
+    _write_cache(_SLEEP_POINTS_CACHE, {
+        "lat": latitude,
+        "lon": longitude,
+        "forecast_url": forecast_url
+    })
+    return forecast_url
+
+def get_weather_data(session):
     """
     Fetch weather data from weather.gov (National Weather Service) API
     Returns dict with temperature (high, low) and weather condition
@@ -46,39 +194,31 @@ def get_weather_data():
         # Get location from settings.toml (latitude and longitude)
         latitude = get_setting("LATITUDE", "47.6062")  # Seattle default
         longitude = get_setting("LONGITUDE", "-122.3321")
-        
-        # Validate coordinates
-        try:
-            lat_float = float(latitude)
-            lon_float = float(longitude)
-            if not (-90 <= lat_float <= 90) or not (-180 <= lon_float <= 180):
-                raise ValueError("Coordinates out of valid range")
-        except (ValueError, TypeError):
-            latitude = "47.6062"
-            longitude = "-122.3321"
+        # Invalid coordinates are rejected by weather.gov, which ends in the
+        # same placeholder data as any other fetch error
+
+        # Return cached forecast if it's recent enough
+        cached = _read_cache(_SLEEP_FORECAST_CACHE)
+        if cached and "data" in cached:
+            age = time.time() - cached.get("ts", 0)
+            if 0 <= age < _CACHE_MAX_AGE:
+                return cached["data"]
 
         # Step 1: Get the forecast grid endpoint for this location
-        points_url = f"https://api.weather.gov/points/{latitude},{longitude}"
-        
-        points_response = magtag.network.fetch(points_url)
-        points_data = points_response.json()
-        
-        # Step 2: Get the forecast URL from the points data
-        if "properties" not in points_data or "forecast" not in points_data["properties"]:
-            raise ValueError("Invalid response from points API")
-        
-        forecast_url = points_data["properties"]["forecast"]
-        
-        # Step 3: Fetch the actual forecast
-        forecast_response = magtag.network.fetch(forecast_url)
-        forecast_data = forecast_response.json()
-        
-        # Validate forecast data structure
-        if "properties" not in forecast_data or "periods" not in forecast_data["properties"]:
-            raise ValueError("Invalid response from forecast API")
-        
-        periods = forecast_data["properties"]["periods"]
-        if not periods or len(periods) == 0:
+        # FORECAST_URL in settings.toml skips the lookup entirely
+        forecast_url = get_setting("FORECAST_URL")
+        if not forecast_url:
+            forecast_url = _get_forecast_url(session, latitude, longitude)
+
+        # Step 3: Fetch the actual forecast, parsing only the periods we use
+        # (same host as the points call, so the session reuses its socket)
+        forecast_response = session.get(forecast_url, headers=_HEADERS, stream=True)
+        try:
+            periods = _read_periods(forecast_response, 4)
+        finally:
+            forecast_response.close()
+
+        if not periods:
             raise ValueError("No forecast periods available")
         
         # Get today's forecast (first period)
@@ -90,7 +230,8 @@ def get_weather_data():
         temp_low = "--"
         condition = "Unknown"
 
-        for period in periods[:4]:  # Check first 4 periods
+        for i in range(min(4, len(periods))):  # Check first 4 periods
+            period = periods[i]
             if period.get("isDaytime", False):
                 if temp_high == "--":
                     temp_high = period.get("temperature", "--")
@@ -98,6 +239,8 @@ def get_weather_data():
             else:
                 if temp_low == "--":
                     temp_low = period.get("temperature", "--")
+            if temp_high != "--" and temp_low != "--":
+                break
 
         # Fallback if we didn't find proper day/night periods
         if temp_high == "--":
@@ -106,12 +249,14 @@ def get_weather_data():
         if temp_low == "--":
             temp_low = temp_high
 
-        return {
+        result = {
             "temp_high": temp_high,
             "temp_low": temp_low,
             "condition": condition,
             "units": "°F"  # weather.gov always returns Fahrenheit
         }
+        _write_cache(_SLEEP_FORECAST_CACHE, {"ts": time.time(), "data": result})
+        return result
     except Exception:
         return {
             "temp_high": "--",
@@ -120,195 +265,428 @@ def get_weather_data():
             "units": "°F"
         }
 
+# Common weather.gov shortForecast strings mapped directly to icon types
+_ICON_EXACT = {
+    "Sunny": "sun",
+    "Mostly Sunny": "sun",
+    "Partly Sunny": "sun",
+    "Clear": "sun",
+    "Mostly Clear": "sun",
+    "Partly Cloudy": "cloud",
+    "Mostly Cloudy": "cloud",
+    "Cloudy": "cloud",
+    "Light Rain": "rain",
+    "Rain": "rain",
+    "Rain Showers": "rain",
+    "Chance Rain Showers": "rain",
+    "Slight Chance Rain Showers": "rain",
+    "Light Snow": "snow",
+    "Snow": "snow",
+    "Patchy Fog": "fog",
+    "Areas Of Fog": "fog",
+    "Fog": "fog",
+}
+
+# Substring fallbacks, checked in priority order
+_ICON_SUBSTRINGS = (
+    ("sunny", "sun"),
+    ("clear", "sun"),
+    ("rain", "rain"),
+    ("shower", "rain"),
+    ("drizzle", "rain"),
+    ("thunder", "storm"),
+    ("storm", "storm"),
+    ("snow", "snow"),
+    ("flurr", "snow"),
+    ("fog", "fog"),
+    ("mist", "fog"),
+    ("haze", "fog"),
+    ("wind", "wind"),
+    ("cloud", "cloud"),
+    ("overcast", "cloud"),
+    ("partly", "cloud"),
+    ("mostly", "cloud"),
+)
+
 def get_weather_icon_type(condition):
     """
     Return weather icon type based on condition
     Maps weather.gov shortForecast descriptions to icon types
     """
-    condition_lower = condition.lower()
+    icon_type = _ICON_EXACT.get(condition)
+    if icon_type:
+        return icon_type
 
-    if "sunny" in condition_lower or "clear" in condition_lower:
-        return "sun"
-    elif "rain" in condition_lower or "shower" in condition_lower or "drizzle" in condition_lower:
-        return "rain"
-    elif "thunder" in condition_lower or "storm" in condition_lower:
-        return "storm"
-    elif "snow" in condition_lower or "flurr" in condition_lower:
-        return "snow"
-    elif "fog" in condition_lower or "mist" in condition_lower or "haze" in condition_lower:
-        return "fog"
-    elif "wind" in condition_lower:
-        return "wind"
-    elif "cloud" in condition_lower or "overcast" in condition_lower or "partly" in condition_lower or "mostly" in condition_lower:
-        return "cloud"
-    else:
-        return "unknown"
+    condition_lower = condition.lower()
+    for substring, icon_type in _ICON_SUBSTRINGS:
+        if substring in condition_lower:
+            return icon_type
+    return "unknown"
+
+# Placeholder "X" icon shown when an icon can't be loaded, built once
+_FALLBACK_BITMAP = displayio.Bitmap(100, 100, 2)
+_FALLBACK_PALETTE = displayio.Palette(2)
+_FALLBACK_PALETTE[0] = WHITE
+_FALLBACK_PALETTE[1] = BLACK
+bitmaptools.draw_line(_FALLBACK_BITMAP, 0, 0, 99, 99, 1)
+bitmaptools.draw_line(_FALLBACK_BITMAP, 99, 0, 0, 99, 1)
+
+# Map icon type to filename
+# The .bin files are raw bitmap data made from icons/*.bmp by tools/convert_icons.py
+_ICON_FILES = {
+    "sun": "/icons/icon_sun.bin",
+    "cloud": "/icons/icon_cloud.bin",
+    "rain": "/icons/icon_rain.bin",
+    "snow": "/icons/icon_snow.bin",
+    "storm": "/icons/icon_storm.bin",
+    "fog": "/icons/icon_fog.bin",
+    "wind": "/icons/icon_wind.bin",
+    "unknown": "/icons/icon_unknown.bin",
+}
+
+# Icons are 100x100 pixel 1-bit images sharing one palette
+_ICON_SIZE = const(100)
+_ICON_BYTES = const(_ICON_SIZE * ((_ICON_SIZE + 31) // 32 * 4))  # rows padded to 32 bits
+_ICON_PALETTE = displayio.Palette(2)
+_ICON_PALETTE[0] = BLACK
+_ICON_PALETTE[1] = WHITE
+
+# Loaded icons for this wake, keyed by icon type
+_ICON_CACHE = {}
+
+def _get_icon(icon_type):
+    """Return the bitmap for an icon type, loading it on first use"""
+    icon = _ICON_CACHE.get(icon_type)
+    if icon is None:
+        filename = _ICON_FILES.get(icon_type, "/icons/icon_unknown.bin")
+        icon = displayio.Bitmap(_ICON_SIZE, _ICON_SIZE, 2)
+        # Read the file straight into the bitmap's buffer; no BMP parsing
+        with open(filename, "rb") as f:
+            if f.readinto(icon) != _ICON_BYTES:
+                raise ValueError("Icon file has the wrong size")
+        _ICON_CACHE[icon_type] = icon
+    return icon
 
 def load_weather_icon(icon_type, x, y):
     """
-    Load a weather icon BMP file and return a displayio.Group
-    Icons are 100x100 pixel 1-bit BMPs
+    Load a weather icon and return a displayio.Group
+    Icons are 100x100 pixel 1-bit bitmaps
     """
     icon_group = displayio.Group(x=x, y=y)
 
-    # Map icon type to filename
-    icon_files = {
-        "sun": "/icons/icon_sun.bmp",
-        "cloud": "/icons/icon_cloud.bmp",
-        "rain": "/icons/icon_rain.bmp",
-        "snow": "/icons/icon_snow.bmp",
-        "storm": "/icons/icon_storm.bmp",
-        "fog": "/icons/icon_fog.bmp",
-        "wind": "/icons/icon_wind.bmp",
-        "unknown": "/icons/icon_unknown.bmp",
-    }
-
-    filename = icon_files.get(icon_type, "/icons/icon_unknown.bmp")
-
     try:
-        icon_bitmap, icon_palette = adafruit_imageload.load(
-            filename, bitmap=displayio.Bitmap, palette=displayio.Palette
-        )
-        tile_grid = displayio.TileGrid(icon_bitmap, pixel_shader=icon_palette)
+        icon_bitmap = _get_icon(icon_type)
+        tile_grid = displayio.TileGrid(icon_bitmap, pixel_shader=_ICON_PALETTE)
         icon_group.append(tile_grid)
     except Exception:
-        # Fallback: create a simple placeholder
-        placeholder = displayio.Bitmap(100, 100, 2)
-        palette = displayio.Palette(2)
-        palette[0] = WHITE
-        palette[1] = BLACK
-        # Draw X
-        for i in range(100):
-            placeholder[i, i] = 1
-            placeholder[99 - i, i] = 1
-        tile_grid = displayio.TileGrid(placeholder, pixel_shader=palette)
+        # Fallback: simple placeholder
+        tile_grid = displayio.TileGrid(_FALLBACK_BITMAP, pixel_shader=_FALLBACK_PALETTE)
         icon_group.append(tile_grid)
 
     return icon_group
 
+# The RTC only drifts seconds per day, so NTP is needed about once a week
+_NTP_SYNC_DAYS = const(7)
+
+# The RTC starts at 2000 after a reset until NTP sets it
+_MIN_VALID_YEAR = const(2024)
+_CLOCK_RETRY_SECONDS = const(3600)
+
+# Do a full refresh at least this often to clear quick-refresh ghosting
+_FULL_REFRESH_DAYS = const(7)
+
+# Quick refresh waveform (LUT) for the IL0373 panel on the original MagTag.
+# Each LUT has a single short drive phase instead of the multi-phase
+# grayscale waveform the board uses by default
+_QUICK_FRAMES = const(0x14)
+
+def _quick_lut(command, level, length):
+    """Build a one-phase LUT command for the start sequence"""
+    return bytes((command, length, level, _QUICK_FRAMES, 0, 0, 0, 1)) + bytes(length - 6)
+
+_QUICK_START_SEQUENCE = (
+    b"\x01\x05\x03\x00\x2b\x2b\x13"  # power setting
+    b"\x06\x03\x17\x17\x17"  # booster soft start
+    b"\x04\x80\xc8"  # power on and wait 200 ms
+    b"\x00\x01\xbf"  # panel setting: LUTs from registers
+    b"\x30\x01\x3c"  # PLL
+    b"\x61\x03\x80\x01\x28"  # resolution 128x296
+    b"\x82\x01\x12"  # VCM DC
+    b"\x50\x01\x97"  # VCOM and data interval
+    + _quick_lut(0x20, 0x00, 44)  # VCOM
+    + _quick_lut(0x21, 0x80, 42)  # white
+    + _quick_lut(0x22, 0x80, 42)  # light gray
+    + _quick_lut(0x23, 0x40, 42)  # dark gray
+    + _quick_lut(0x24, 0x40, 42)  # black
+)
+
+def refresh_display():
+    """
+    Refresh the e-ink display, using the quick waveform when enabled
+    A full refresh is still done weekly and after a reset to clear ghosting
+    """
+    mem = alarm.sleep_memory
+    quick_refreshes = mem[_SLEEP_QUICK_REFRESHES]
+    quick = (get_setting("QUICK_REFRESH", 0)
+             and alarm.wake_alarm is not None
+             and quick_refreshes < _FULL_REFRESH_DAYS - 1)
+    if quick:
+        try:
+            # The default waveform comes back on its own after deep sleep
+            board.DISPLAY.update_refresh_mode(_QUICK_START_SEQUENCE, 5.0)
+        except Exception:
+            quick = False
+
+    # Force display refresh for e-ink (wait exactly until the display is ready)
+    time_to_refresh = board.DISPLAY.time_to_refresh
+    if time_to_refresh > 0:
+        time.sleep(time_to_refresh)
+    board.DISPLAY.refresh()
+    # The display driver owns the BUSY pin, so a PinAlarm can't watch it;
+    # sleep between checks instead of spinning the CPU
+    while board.DISPLAY.busy:
+        time.sleep(0.1)
+
+    mem[_SLEEP_QUICK_REFRESHES] = quick_refreshes + 1 if quick else 0
+
+_NO_TEMP = const(-32768)  # Stored in place of "--"
+
+def _display_state(current_time, weather):
+    """
+    Pack the values shown on screen, used to skip unneeded refreshes
+    Month, day, high, low, and a CRC of the condition text
+    """
+    high = weather["temp_high"]
+    low = weather["temp_low"]
+    return struct.pack(
+        "<BBhhI",
+        current_time.tm_mon,
+        current_time.tm_mday,
+        high if isinstance(high, int) else _NO_TEMP,
+        low if isinstance(low, int) else _NO_TEMP,
+        binascii.crc32(weather["condition"].encode())
+    )
+
+# Large digits are drawn by copying terminalio glyphs into a small bitmap
+# per screen area, which is then scaled up by its Group instead of a Label
+_GLYPH_WIDTH, _GLYPH_HEIGHT = terminalio.FONT.get_bounding_box()[:2]
+_TEXT_PALETTE = displayio.Palette(2)
+_TEXT_PALETTE[0] = WHITE
+_TEXT_PALETTE[1] = BLACK
+
+def _create_text_area(columns, scale, x, y):
+    """
+    Create a bitmap for one line of large text and the scaled Group showing it
+    (x, y) is the top-left corner on screen
+    """
+    bitmap = displayio.Bitmap(columns * _GLYPH_WIDTH, _GLYPH_HEIGHT, 2)
+    group = displayio.Group(scale=scale, x=x, y=y)
+    group.append(displayio.TileGrid(bitmap, pixel_shader=_TEXT_PALETTE))
+    return bitmap, group
+
+def draw_text(bitmap, text):
+    """Clear a text area bitmap and draw text into it"""
+    font_bitmap = terminalio.FONT.bitmap
+    tiles_per_row = font_bitmap.width // _GLYPH_WIDTH
+    bitmap.fill(0)
+
+    x = 0
+    for char in text:
+        if x + _GLYPH_WIDTH > bitmap.width:
+            break  # Truncate if too long
+        glyph = terminalio.FONT.get_glyph(ord(char))
+        if glyph is not None:
+            src_x = (glyph.tile_index % tiles_per_row) * _GLYPH_WIDTH
+            src_y = (glyph.tile_index // tiles_per_row) * _GLYPH_HEIGHT
+            bitmaptools.blit(
+                bitmap, font_bitmap, x, 0,
+                x1=src_x, y1=src_y,
+                x2=src_x + _GLYPH_WIDTH, y2=src_y + _GLYPH_HEIGHT
+            )
+        x += _GLYPH_WIDTH
+
 def create_display():
-    """Create the display layout with date, weather, and temperature"""
+    """
+    Create the display layout with date, weather, and temperature
+    Only the parts that don't need the network are filled in here, so this
+    can run before WiFi connects. Returns a dict of the labels and text
+    bitmaps to update.
+    """
 
     # Clear any existing display
     splash = displayio.Group()
 
-    # Add white background
-    color_bitmap = displayio.Bitmap(SCREEN_WIDTH, SCREEN_HEIGHT, 1)
+    # Add white background: a 1x1 bitmap scaled up to cover the screen
+    # (a tiled TileGrid would need one tile index per pixel)
+    color_bitmap = displayio.Bitmap(1, 1, 1)
     color_palette = displayio.Palette(1)
     color_palette[0] = WHITE
     bg_sprite = displayio.TileGrid(color_bitmap, pixel_shader=color_palette, x=0, y=0)
-    splash.append(bg_sprite)
-    
-    # Get current time
-    current_time = time.localtime()
-    
-    # Month names
-    months = ["", "January", "February", "March", "April", "May", "June",
-              "July", "August", "September", "October", "November", "December"]
-    
-    # Day names
-    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    
-    # Format date components
-    month_name = months[current_time.tm_mon]
-    day_name = days[current_time.tm_wday]
-    date_num = current_time.tm_mday
-    
-    # Get weather data
-    weather = get_weather_data()
-    weather_icon_type = get_weather_icon_type(weather["condition"])
-    
+    bg_group = displayio.Group(scale=max(SCREEN_WIDTH, SCREEN_HEIGHT))
+    bg_group.append(bg_sprite)
+    splash.append(bg_group)
+
     # LEFT SECTION: Date and Day
     # Month name (top left) - full name
     month_label = label.Label(
         terminalio.FONT,
-        text=month_name.upper(),
+        text="",
         color=BLACK,
         scale=2,
-        x=5,
-        y=12
+        x=_LEFT_X,
+        y=_MONTH_Y
     )
     splash.append(month_label)
 
     # Date number (large, left side)
-    date_label = label.Label(
-        terminalio.FONT,
-        text=str(date_num),
-        color=BLACK,
-        scale=6,
-        x=5,
-        y=60
-    )
-    splash.append(date_label)
+    date_bitmap, date_group = _create_text_area(2, 6, _LEFT_X, _DATE_Y)
+    splash.append(date_group)
 
     # Day of week (bottom left) - full name
     day_label = label.Label(
         terminalio.FONT,
-        text=day_name.upper(),
+        text="",
         color=BLACK,
         scale=2,
-        x=5,
-        y=115
+        x=_LEFT_X,
+        y=_DAY_Y
     )
     splash.append(day_label)
-    
-    # MIDDLE SECTION: Weather Icon (100x100 BMP)
-    # Position icon to fit - display is 296x128, icon is 100x100
-    icon_x = 110  # Centered in middle area
-    icon_y = 14   # Vertically centered (128 - 100) / 2 = 14
 
-    # Load weather icon from BMP file
-    weather_icon = load_weather_icon(weather_icon_type, icon_x, icon_y)
-    splash.append(weather_icon)
+    # MIDDLE SECTION: Weather Icon (100x100)
+    # Filled in by show_weather() once the icon type is known
+    icon_group = displayio.Group(x=_ICON_X, y=_ICON_Y)
+    splash.append(icon_group)
 
     # Weather condition text at bottom of screen (below the icon area)
-    condition_text = weather["condition"]
     condition_label = label.Label(
         terminalio.FONT,
-        text=condition_text[:16],  # Truncate if too long
+        text="",
         color=BLACK,
-        x=icon_x,
-        y=120
+        x=_ICON_X,
+        y=_CONDITION_Y
     )
     splash.append(condition_label)
 
     # RIGHT SECTION: Temperature - just numbers, stacked, larger
     # High temperature (top)
-    high_label = label.Label(
-        terminalio.FONT,
-        text=str(weather['temp_high']),
-        color=BLACK,
-        scale=4,
-        x=SCREEN_WIDTH - 55,
-        y=35
-    )
-    splash.append(high_label)
+    high_bitmap, high_group = _create_text_area(3, 4, _TEMP_X, _HIGH_Y)
+    splash.append(high_group)
 
     # Low temperature (bottom)
-    low_label = label.Label(
-        terminalio.FONT,
-        text=str(weather['temp_low']),
-        color=BLACK,
-        scale=4,
-        x=SCREEN_WIDTH - 55,
-        y=90
-    )
-    splash.append(low_label)
+    low_bitmap, low_group = _create_text_area(3, 4, _TEMP_X, _LOW_Y)
+    splash.append(low_group)
+
+    layout = {
+        "splash": splash,
+        "month": month_label,
+        "date": date_bitmap,
+        "day": day_label,
+        "icon": icon_group,
+        "condition": condition_label,
+        "high": high_bitmap,
+        "low": low_bitmap,
+    }
+    set_date(layout)
+    return layout
+
+# Month names
+_MONTHS = ("", "January", "February", "March", "April", "May", "June",
+           "July", "August", "September", "October", "November", "December")
+
+# Day names
+_DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+def set_date(layout):
+    """Fill in the date labels from the current time"""
+
+    # Get current time
+    current_time = time.localtime()
     
+    # Format date components
+    month_name = _MONTHS[current_time.tm_mon]
+    day_name = _DAYS[current_time.tm_wday]
+    date_num = current_time.tm_mday
+
+    layout["month"].text = month_name.upper()
+    draw_text(layout["date"], str(date_num))
+    layout["day"].text = day_name.upper()
+
+def show_weather(layout, session):
+    """Fetch the weather, fill in the rest of the layout, and refresh the display"""
+
+    # Get weather data
+    weather = get_weather_data(session)
+    weather_icon_type = get_weather_icon_type(weather["condition"])
+
+    # Skip the e-ink refresh if the screen already shows this data. Only
+    # timer wakes can skip; a reset or the button always redraws
+    state = _display_state(time.localtime(), weather)
+    mem = alarm.sleep_memory
+    old_state = bytes(mem[_SLEEP_STATE:_SLEEP_STATE + _SLEEP_STATE_SIZE])
+    if state == old_state and isinstance(alarm.wake_alarm, alarm.time.TimeAlarm):
+        return
+
+    # Load weather icon
+    layout["icon"].append(load_weather_icon(weather_icon_type, 0, 0))
+
+    condition_text = weather["condition"]
+    layout["condition"].text = condition_text[:16]  # Truncate if too long
+    draw_text(layout["high"], str(weather['temp_high']))
+    draw_text(layout["low"], str(weather['temp_low']))
+
     # Display the layout
-    board.DISPLAY.root_group = splash
+    board.DISPLAY.root_group = layout["splash"]
 
-    # Force display refresh for e-ink (wait for display to be ready)
-    while board.DISPLAY.time_to_refresh > 0:
-        time.sleep(0.5)
-    board.DISPLAY.refresh()
-    while board.DISPLAY.busy:
-        pass
+    refresh_display()
+
+    mem[_SLEEP_STATE:_SLEEP_STATE + _SLEEP_STATE_SIZE] = state
+
+
+def sync_time(pool):
+    """
+    Set the RTC from NTP after a reset, when the clock was never set, and
+    about once a week otherwise. Returns True if the time was synced
+    """
+    mem = alarm.sleep_memory
+    wakes = mem[_SLEEP_NTP_WAKES]
+    if (alarm.wake_alarm is not None and wakes < _NTP_SYNC_DAYS - 1
+            and time.localtime().tm_year >= _MIN_VALID_YEAR):
+        mem[_SLEEP_NTP_WAKES] = wakes + 1
+        return False
+
+    try:
+        import rtc
+        import adafruit_ntp
+
+        ntp = adafruit_ntp.NTP(pool, tz_offset=-8)  # PST = UTC-8
+        rtc.RTC().datetime = ntp.datetime
+    except Exception:
+        return False  # Use device time if NTP fails, and retry next wake
+
+    mem[_SLEEP_NTP_WAKES] = 0
+    return True
 
+def deep_sleep(sleep_seconds):
+    """
+    Deep sleep until the timer runs out or button A is pressed
+    Pressing the button wakes the MagTag for an early refresh
+    """
+    time_alarm = alarm.time.TimeAlarm(monotonic_time=time.monotonic() + sleep_seconds)
+    # The MagTag library holds the button pin; release it for the alarm
+    magtag.peripherals.buttons[0].deinit()
+    button_alarm = alarm.pin.PinAlarm(pin=board.BUTTON_A, value=False, pull=True)
+    alarm.exit_and_deep_sleep_until_alarms(time_alarm, button_alarm)
 
 def seconds_until_midnight():
-    """Calculate seconds until next midnight"""
+    """
+    Calculate seconds until next midnight
+    If the clock has never been set (NTP failed after a reset), retry in an
+    hour instead of waking at a midnight that isn't real
+    """
     now = time.localtime()
+    if now.tm_year < _MIN_VALID_YEAR:
+        return _CLOCK_RETRY_SECONDS
     # Seconds since midnight
     seconds_today = now.tm_hour * 3600 + now.tm_min * 60 + now.tm_sec
     # Seconds in a day minus seconds since midnight
@@ -317,26 +695,41 @@ def seconds_until_midnight():
 def main():
     """Main function to run the MagTag calendar display"""
 
+    # Load the "unknown" icon and build the date part of the display before
+    # connecting, so WiFi only needs to be up for the fetch; the RTC keeps
+    # time through deep sleep
+    try:
+        _get_icon("unknown")
+    except Exception:
+        pass  # load_weather_icon falls back to the placeholder
+    layout = create_display()
+
     # Connect to WiFi
     try:
         magtag.network.connect()
     except Exception:
         pass  # Continue with placeholder data if WiFi fails
 
-    # Sync time using NTP (no Adafruit IO needed)
+    # One HTTPS session shared by both weather.gov requests so the
+    # TLS connection is set up only once
+    pool = None
+    session = None
     try:
         pool = socketpool.SocketPool(wifi.radio)
-        ntp = adafruit_ntp.NTP(pool, tz_offset=-8)  # PST = UTC-8
-        rtc.RTC().datetime = ntp.datetime
+        session = adafruit_requests.Session(pool, ssl.create_default_context())
     except Exception:
-        pass  # Use device time if NTP fails
+        pass  # get_weather_data falls back to cached or placeholder data
+
+    # Sync time using NTP (no Adafruit IO needed)
+    if pool is not None and sync_time(pool):
+        set_date(layout)  # In case the RTC was off
 
-    # Create and show the display
-    create_display()
+    # Add the weather and show the display
+    show_weather(layout, session)
 
     # Calculate seconds until midnight and sleep until then
     sleep_seconds = seconds_until_midnight()
-    magtag.exit_and_deep_sleep(sleep_seconds)
+    deep_sleep(sleep_seconds)
 
 # Run the main function
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+"""
+Convert the 1-bit weather icon BMPs to raw displayio.Bitmap data
+Run on a computer (not the MagTag) after changing any icons/*.bmp file:
+
+    python tools/convert_icons.py
+
+Each icons/icon_*.bin file holds the pixels in the layout displayio.Bitmap
+uses in memory for a 1-bit bitmap: rows top to bottom, each padded to a
+whole number of 32-bit words, with pixel 0 in the most significant bit of a
+little-endian word. code.py reads the file straight into the bitmap buffer.
+"""
+
+import glob
+import os
+import struct
+
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "icons")
+
+
+def convert(bmp_path):
+    """Convert one BMP file and write the .bin next to it"""
+    with open(bmp_path, "rb") as f:
+        data = f.read()
+
+    if data[:2] != b"BM":
+        raise ValueError(f"{bmp_path}: not a BMP file")
+    pixel_offset = struct.unpack_from("<I", data, 10)[0]
+    width, height = struct.unpack_from("<ii", data, 18)
+    bits_per_pixel = struct.unpack_from("<H", data, 28)[0]
+    compression = struct.unpack_from("<I", data, 30)[0]
+    if bits_per_pixel != 1 or compression != 0:
+        raise ValueError(f"{bmp_path}: expected an uncompressed 1-bit BMP")
+
+    # BMP rows are MSB-first bytes padded to 4 bytes, which matches the
+    # bitmap's row stride; only the byte order within each word differs
+    stride = (width + 31) // 32 * 4
+    bottom_up = height > 0
+    height = abs(height)
+
+    raw = bytearray()
+    for y in range(height):
+        row_y = height - 1 - y if bottom_up else y
+        start = pixel_offset + row_y * stride
+        row = data[start:start + stride]
+        for i in range(0, stride, 4):
+            raw += row[i:i + 4][::-1]
+
+    bin_path = os.path.splitext(bmp_path)[0] + ".bin"
+    with open(bin_path, "wb") as f:
+        f.write(raw)
+    print(f"{bin_path}: {width}x{height}, {len(raw)} bytes")
+
+
+def main():
+    for bmp_path in sorted(glob.glob(os.path.join(ICON_DIR, "icon_*.bmp"))):
+        convert(bmp_path)
+
+
+if __name__ == "__main__":
+    main()